@@ -1,7 +1,9 @@
 import copy
+import functools
 import importlib.metadata
-import inspect
+import operator
 import sys
+import threading
 from types import GenericAlias
 from typing import (
     TYPE_CHECKING,
@@ -9,6 +11,8 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
+    Hashable,
     List,
     Literal,
     Mapping,
@@ -20,13 +24,15 @@ from typing import (
     get_origin,
 )
 
-from cached_classproperty import cached_classproperty
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic._internal._model_construction import ModelMetaclass
 from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefined
 from typing_extensions import Annotated, Iterable, Self, dataclass_transform
 
+if sys.version_info >= (3, 10):
+    from types import UnionType
+
 if sys.version_info > (3, 13):
     annotated_class_getitem = Annotated.__getitem__
 else:
@@ -38,89 +44,342 @@ __version__ = importlib.metadata.version("pydantic_duality")
 REQUEST_ATTR = "__request__"
 RESPONSE_ATTR = "__response__"
 PATCH_REQUEST_ATTR = "__patch_request__"
+ALL_VARIANTS_ATTR = "__all_variants__"
+DUAL_HASH_ATTR = "__dual_hash__"
+
+# Saves a builtins lookup plus an attribute lookup on every proxied attribute access
+_type_getattribute = type.__getattribute__
+
+# Attributes that DualBaseModelMeta.__getattribute__ never proxies to the request model
+_METACLASS_OWN_ATTRS = frozenset(
+    {
+        REQUEST_ATTR,
+        "__new__",
+        "_generate_base_alternative_classes",
+        "_generate_alternative_classes",
+        "_get_all_variants",
+    }
+)
+
+# Keyed by (id(annotation), attr). The annotation itself is stored next to the result
+# so that a recycled id can never produce a false hit and so that it stays alive.
+_RESOLVE_CACHE: Dict[Tuple[int, str], Tuple[Any, Any]] = {}
+_RESOLVE_CACHE_MAXSIZE = 4096
+
+# Identical class definitions (e.g. dual models created in a loop) return the same class
+# when reuse_definitions is enabled.
+# Values hold the namespace alongside the class to keep the id()s in the key alive.
+_CLASS_CACHE: Dict[Hashable, Tuple[type, Dict[str, object]]] = {}
+_CLASS_CACHE_MAXSIZE = 1024
+_IMMUTABLE_ATTR_TYPES = (str, bytes, int, bool, type(None))
 
 
 def _replace_with_or_none(val: Any) -> Any:
-    if (
-        isinstance(val, FieldInfo) and val.default is PydanticUndefined
-    ):  # pragma: no cover
-        val = copy.deepcopy(val)
+    if isinstance(val, FieldInfo) and val.default is PydanticUndefined:
+        # A shallow copy is enough: only the default-related attributes are changed
+        if hasattr(val, "_copy"):
+            val = val._copy()
+        else:  # pragma: no cover
+            val = copy.copy(val)
+            val.metadata = val.metadata.copy()
+            val._attributes_set = val._attributes_set.copy()
         val.default = None
-    else:
-        return val
+        val.default_factory = None
+        val._attributes_set["default"] = None
+        val._attributes_set.pop("default_factory", None)
+    return val
 
 
 def _resolve_annotation(annotation, attr: str) -> Any:
-    if inspect.isclass(annotation) and isinstance(annotation, DualBaseModelMeta):
+    # Plain classes and regular pydantic models are by far the most common leaves
+    annotation_type = type(annotation)
+    if annotation_type is type or annotation_type is ModelMetaclass:
+        return annotation
+    if annotation_type is DualBaseModelMeta:
+        # As cheap as a cache hit and caching it would keep dynamically created models alive
         return getattr(annotation, attr)
-    if get_origin(annotation) is Annotated:
-        return annotated_class_getitem(
-            tuple(_resolve_annotation(a, attr) for a in get_args(annotation)),
-        )
+    key = (id(annotation), attr)
+    cached = _RESOLVE_CACHE.get(key)
+    if cached is not None and cached[0] is annotation:
+        return cached[1]
+    resolved = _resolve_annotation_uncached(annotation, attr)
+    if len(_RESOLVE_CACHE) >= _RESOLVE_CACHE_MAXSIZE:
+        _RESOLVE_CACHE.clear()
+    _RESOLVE_CACHE[key] = (annotation, resolved)
+    return resolved
+
+
+def _resolve_annotation_uncached(annotation, attr: str) -> Any:
+    resolver = _TYPE_RESOLVERS.get(type(annotation))
+    if resolver is None:
+        if isinstance(annotation, type):
+            # Classes with a custom metaclass such as enums. Dual models never get here
+            return annotation
+        resolver = _ORIGIN_RESOLVERS.get(get_origin(annotation))
+        if resolver is None:
+            return annotation
+    return resolver(annotation, attr)
+
+
+# The resolvers below read __origin__/__args__ directly: every shape they are
+# registered for has them and typing's get_origin/get_args are much slower
+def _resolve_args(args: Tuple[Any, ...], attr: str) -> Optional[Tuple[Any, ...]]:
+    """Returns None if none of the args changed so that the caller can keep its annotation.
+
+    Rebuilding an annotation makes typing validate (and, for unions, deduplicate) all of its args again.
+    """
+    resolved = tuple(_resolve_annotation(a, attr) for a in args)
+    if all(r is a for r, a in zip(resolved, args)):
+        return None
+    return resolved
+
+
+def _resolve_dual_model(annotation, attr: str) -> Any:
+    return getattr(annotation, attr)
+
+
+def _resolve_annotated(annotation, attr: str) -> Any:
+    args = _resolve_args((annotation.__origin__, *annotation.__metadata__), attr)
+    if args is None:
+        return annotation
+    return annotated_class_getitem(args)
 
-    if isinstance(annotation, GenericAlias):
-        return GenericAlias(
-            get_origin(annotation),
-            tuple(_resolve_annotation(a, attr) for a in get_args(annotation)),
-        )
-    if inspect.isclass(annotation) and isinstance(annotation, ModelMetaclass):
+
+def _resolve_generic_alias(annotation, attr: str) -> Any:
+    args = _resolve_args(annotation.__args__, attr)
+    if args is None:
         return annotation
-    if get_origin(annotation) is Union:
-        return Union.__getitem__(
-            tuple(_resolve_annotation(a, attr) for a in get_args(annotation))
-        )
-    if get_origin(annotation) is list:
-        return List.__getitem__(
-            tuple(_resolve_annotation(a, attr) for a in get_args(annotation))
-        )
-    return annotation
+    return GenericAlias(annotation.__origin__, args)
+
+
+def _resolve_union(annotation, attr: str) -> Any:
+    args = _resolve_args(annotation.__args__, attr)
+    if args is None:
+        return annotation
+    return Union.__getitem__(args)
+
+
+def _resolve_union_type(annotation, attr: str) -> Any:
+    args = _resolve_args(annotation.__args__, attr)
+    if args is None:
+        return annotation
+    # Keeps the X | Y form. It's built in C and never goes through typing's cache
+    return functools.reduce(operator.or_, args)
 
 
-def _alter_attrs(attrs: Dict[str, object], name: str, suffix: str, attr: str):
+def _resolve_typing_generic(annotation, attr: str) -> Any:
+    # typing.List[...], typing.Dict[...] and friends all share one alias class
+    resolver = _ORIGIN_RESOLVERS.get(annotation.__origin__)
+    if resolver is None:
+        return annotation
+    return resolver(annotation, attr)
+
+
+def _resolve_list(annotation, attr: str) -> Any:
+    args = _resolve_args(annotation.__args__, attr)
+    if args is None:
+        return annotation
+    return List.__getitem__(args)
+
+
+# Checked by the exact type of the annotation first and by its origin second.
+# DualBaseModelMeta is registered right after its definition.
+_TYPE_RESOLVERS: Dict[type, Callable[[Any, str], Any]] = {
+    GenericAlias: _resolve_generic_alias,
+    # typing's private alias classes. The origin table still covers other implementations
+    type(Union[int, str]): _resolve_union,
+    type(Annotated[int, None]): _resolve_annotated,
+    type(List[int]): _resolve_typing_generic,
+}
+if sys.version_info >= (3, 10):
+    _TYPE_RESOLVERS[UnionType] = _resolve_union_type
+_ORIGIN_RESOLVERS: Dict[Any, Callable[[Any, str], Any]] = {
+    Annotated: _resolve_annotated,
+    Union: _resolve_union,
+    list: _resolve_list,
+}
+
+
+def _make_patch_annotation(key: str, annotation: Any, attrs: Dict[str, object]) -> Any:
+    """Makes the field optional. Single-value literals become the field's default instead"""
+    if isinstance(annotation, str):
+        if annotation.startswith("Optional["):
+            return annotation
+        return f"Optional[{annotation}]"
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        # Keeps the metadata without validating it all over again
+        return annotation.copy_with((Optional[annotation.__origin__],))
+    if origin is Literal and len(annotation.__args__) == 1:
+        attrs[key] = annotation.__args__[0]
+        return annotation
+    return Optional[annotation]
+
+
+def _alter_attrs(
+    attrs: Dict[str, object],
+    name: str,
+    suffix: str,
+    attr: str,
+    invariant_annotations: FrozenSet[str] = frozenset(),
+):
+    # ModelMetaclass writes into the namespace it receives so it can never be shared
     attrs = attrs.copy()
 
     if "__qualname__" in attrs:
         attrs["__qualname__"] = attrs["__qualname__"] + suffix
-    if "Config" in attrs and inspect.isclass(attrs["Config"]):
+    if "Config" in attrs and isinstance(attrs["Config"], type):
         attrs["Config"].__qualname__ = attrs["__qualname__"] + ".Config"
     if "__annotations__" in attrs and isinstance(attrs["__annotations__"], dict):
-        annotations = attrs["__annotations__"].copy()
+        annotations = attrs["__annotations__"]
+        is_patch_request = attr == PATCH_REQUEST_ATTR
+        if not is_patch_request and len(invariant_annotations) == len(annotations):
+            # Only plain types that every variant shares, which is true for most models
+            return attrs
+        # Only copied once an annotation actually changes
+        altered_annotations: Optional[Dict[str, Any]] = None
         for key, val in annotations.items():
-            annotations[key] = _resolve_annotation(val, attr)
-            if attr == PATCH_REQUEST_ATTR:
-                if get_origin(annotations[key]) is Annotated:
-                    args = get_args(annotations[key])
-                    annotations[key] = annotated_class_getitem(
-                        tuple([Optional[args[0]], *args[1:]])
-                    )
-                elif isinstance(annotations[key], str):
-                    annotations[key] = f"Optional[{annotations[key]}]"
-                elif get_origin(annotations[key]) == Literal:
-                    if len(get_args(annotations[key])) == 1:
-                        attrs[key] = get_args(annotations[key])[0]
-                    else:
-                        annotations[key] = Optional[annotations[key]]
-                else:
-                    annotations[key] = Optional[annotations[key]]
-        attrs["__annotations__"] = annotations
+            new_val = val
+            if key not in invariant_annotations:
+                new_val = _resolve_annotation(val, attr)
+            if is_patch_request:
+                new_val = _make_patch_annotation(key, new_val, attrs)
+            if new_val is not val:
+                if altered_annotations is None:
+                    altered_annotations = annotations.copy()
+                altered_annotations[key] = new_val
+        if altered_annotations is not None:
+            attrs["__annotations__"] = altered_annotations
     return attrs
 
 
-def _lazily_initalize_models(
-    request_cls: type, own_attr_name: str, constructor: Callable[[], Any]
-):
-    def constructor_wrapper(*a, **kw) -> object:
-        obj = constructor()
-        obj.__request__ = request_cls
-        obj.__response__ = cached_classproperty(
-            lambda cls: request_cls.__response__, RESPONSE_ATTR
-        )
-        obj.__patch_request__ = cached_classproperty(
-            lambda cls: request_cls.__patch_request__, PATCH_REQUEST_ATTR
-        )
-        return obj
+def _get_patch_request_attrs(
+    attrs: Dict[str, object], model_fields: Mapping[str, FieldInfo]
+) -> Dict[str, object]:
+    """Defaults every field of the namespace to None. Only called once the patch request model is needed."""
+    patch_attrs: Dict[str, object] = {
+        key: _replace_with_or_none(val) if key in model_fields else val
+        for key, val in attrs.items()
+    }
+    if "__annotations__" in attrs and isinstance(attrs["__annotations__"], dict):
+        patch_attrs |= {
+            key: None
+            for key in attrs["__annotations__"]
+            if key not in patch_attrs and key in model_fields
+        }
+    return patch_attrs
+
+
+def _resolve_bases(bases: Tuple[type, ...], attr: str) -> Tuple[type, ...]:
+    """Bases are always classes so only the dual ones need resolving and none of them need caching"""
+    return tuple(
+        getattr(b, attr) if isinstance(b, DualBaseModelMeta) else b for b in bases
+    )
+
+
+def _get_invariant_annotations(attrs: Dict[str, object]) -> FrozenSet[str]:
+    """Names of the annotations that cannot reference a dual model and are thus shared by all variants"""
+    annotations = attrs.get("__annotations__")
+    if not isinstance(annotations, dict):
+        return frozenset()
+    return frozenset(
+        key
+        for key, val in annotations.items()
+        if not isinstance(val, DualBaseModelMeta) and not get_args(val)
+    )
+
+
+def _get_class_cache_key(
+    name: str,
+    bases: Tuple[type, ...],
+    attrs: Dict[str, object],
+    options: Tuple[object, ...],
+    kwargs: Dict[str, object],
+) -> Optional[Hashable]:
+    """Returns None if the definition contains anything that cannot be safely reused"""
+    annotations = attrs.get("__annotations__", {})
+    if not isinstance(annotations, dict):
+        return None
+    items = []
+    for key, val in attrs.items():
+        if key == "__annotations__":
+            continue
+        if isinstance(val, tuple) and all(type(v) is str for v in val):
+            # e.g. __static_attributes__
+            items.append((key, tuple, val))
+        elif type(val) in _IMMUTABLE_ATTR_TYPES:
+            # The type is a part of the key because True == 1
+            items.append((key, type(val), val))
+        else:
+            return None
+    cache_key = (
+        name,
+        tuple(id(b) for b in bases),
+        tuple(items),
+        tuple((key, id(val)) for key, val in annotations.items()),
+        options,
+        tuple(kwargs.items()),
+    )
+    try:
+        hash(cache_key)
+    except TypeError:
+        return None
+    return cache_key
+
+
+# Reentrant because building one variant usually builds the variants of nested models
+_LAZY_VARIANT_LOCK = threading.RLock()
 
-    return cached_classproperty(constructor_wrapper, own_attr_name)
+
+class _LazyVariant:
+    """Class attribute that is computed on first access and then replaced with its value
+
+    If is_variant is set, the owner is a request model and the value is one of its variants
+    which gets linked to the request model and to its sibling variants right after it's built.
+    """
+
+    __slots__ = ("owner", "attr_name", "constructor", "is_variant")
+
+    def __init__(
+        self,
+        owner: type,
+        attr_name: str,
+        constructor: Callable[[], Any],
+        is_variant: bool = False,
+    ):
+        self.owner = owner
+        self.attr_name = attr_name
+        self.constructor = constructor
+        self.is_variant = is_variant
+
+    def __get__(self, instance: object, owner: Optional[type] = None) -> Any:
+        with _LAZY_VARIANT_LOCK:
+            # Another thread could have built it while we were waiting for the lock
+            val = self.owner.__dict__[self.attr_name]
+            if val is self:
+                val = self.constructor()
+                if self.is_variant:
+                    _link_variant(self.owner, self.attr_name, val)
+                type.__setattr__(self.owner, self.attr_name, val)
+        return val
+
+
+def _link_variant(request_cls: type, own_attr_name: str, variant: type) -> None:
+    type.__setattr__(variant, REQUEST_ATTR, request_cls)
+    for attr in (RESPONSE_ATTR, PATCH_REQUEST_ATTR):
+        if attr == own_attr_name:
+            value = variant
+        else:
+            value = request_cls.__dict__[attr]
+            # Sibling variants that are already built are linked directly in both directions,
+            # only the ones that don't exist yet need a descriptor
+            if isinstance(value, _LazyVariant):
+                value = _LazyVariant(
+                    variant, attr, functools.partial(getattr, request_cls, attr)
+                )
+            else:
+                type.__setattr__(value, own_attr_name, variant)
+        type.__setattr__(variant, attr, value)
 
 
 @dataclass_transform(kw_only_default=True, field_specifiers=(Field, FieldInfo))
@@ -129,6 +388,11 @@ class DualBaseModelMeta(ModelMetaclass):
     __response__: Self
     __patch_request__: Self
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Dual models are recognized by the exact type of their metaclass
+        _TYPE_RESOLVERS[cls] = _resolve_dual_model
+
     def __new__(
         self,
         name: str,
@@ -138,8 +402,31 @@ class DualBaseModelMeta(ModelMetaclass):
         request_suffix: Optional[str] = None,
         response_suffix: Optional[str] = None,
         patch_request_suffix: Optional[str] = None,
+        defer_variant_build: Optional[bool] = None,
+        reuse_definitions: Optional[bool] = None,
         **kwargs,
     ) -> Self:
+        cache_key = None
+        if reuse_definitions is None:
+            reuse_definitions = any(
+                isinstance(b, DualBaseModelMeta) and b.__reuse_definitions__
+                for b in bases
+            )
+        if reuse_definitions and bases != (BaseModel,):
+            cache_key = _get_class_cache_key(
+                name,
+                bases,
+                attrs,
+                (
+                    request_suffix,
+                    response_suffix,
+                    patch_request_suffix,
+                    defer_variant_build,
+                ),
+                kwargs,
+            )
+            if cache_key is not None and cache_key in _CLASS_CACHE:
+                return _CLASS_CACHE[cache_key][0]  # type: ignore
         new_class = type.__new__(self, name, bases, attrs)
         if not bases or not any(
             isinstance(b, (ModelMetaclass, DualBaseModelMeta)) for b in bases
@@ -163,6 +450,7 @@ class DualBaseModelMeta(ModelMetaclass):
                 raise TypeError(
                     "The first instance of DualBaseModel must pass suffixes for the request, response, and patch request models."
                 )
+            defer_variant_build = bool(defer_variant_build)
             new_class._generate_base_alternative_classes(
                 request_suffix,
                 response_suffix,
@@ -175,6 +463,8 @@ class DualBaseModelMeta(ModelMetaclass):
                 response_suffix or new_class.response_suffix,
                 patch_request_suffix or new_class.patch_request_suffix,
             )
+            if defer_variant_build is None:
+                defer_variant_build = new_class.__defer_variant_build__
             new_class._generate_alternative_classes(
                 name,
                 bases,
@@ -182,12 +472,27 @@ class DualBaseModelMeta(ModelMetaclass):
                 request_suffix,
                 response_suffix,
                 patch_request_suffix,
+                defer_variant_build,
                 kwargs,
             )
 
-        new_class.__request__.request_suffix = request_suffix  # type: ignore
-        new_class.__request__.response_suffix = response_suffix  # type: ignore
-        new_class.__request__.patch_request_suffix = patch_request_suffix  # type: ignore
+        # All of these are written before the class is handed out so that nothing
+        # can have cached a lookup against the class while its namespace still changes
+        request_class = _type_getattribute(new_class, REQUEST_ATTR)
+        request_class.request_suffix = request_suffix
+        request_class.response_suffix = response_suffix
+        request_class.patch_request_suffix = patch_request_suffix
+        request_class.__defer_variant_build__ = defer_variant_build
+        request_class.__reuse_definitions__ = reuse_definitions
+        # Filled by the first isinstance/issubclass check after all variants are built.
+        # Set explicitly so that a subclass never picks up its parent's variants.
+        type.__setattr__(new_class, ALL_VARIANTS_ATTR, None)
+        type.__setattr__(new_class, DUAL_HASH_ATTR, hash(request_class))
+
+        if cache_key is not None:
+            if len(_CLASS_CACHE) >= _CLASS_CACHE_MAXSIZE:
+                _CLASS_CACHE.clear()
+            _CLASS_CACHE[cache_key] = (new_class, attrs)
 
         return new_class
 
@@ -198,13 +503,13 @@ class DualBaseModelMeta(ModelMetaclass):
         kwargs,
         attrs,
     ):
-        model_config = {**attrs["model_config"], **ConfigDict(extra="forbid")}
+        model_config = {**attrs["model_config"], "extra": "forbid"}
 
         BaseRequest = ModelMetaclass(
             f"Base{request_suffix}", (BaseModel,), {"model_config": model_config}
         )
 
-        model_config = {**attrs["model_config"], **ConfigDict(extra="ignore")}
+        model_config = {**attrs["model_config"], "extra": "ignore"}
 
         BaseResponse = ModelMetaclass(
             f"Base{response_suffix}", (BaseModel,), {"model_config": model_config}
@@ -223,98 +528,145 @@ class DualBaseModelMeta(ModelMetaclass):
         request_suffix,
         response_suffix,
         patch_request_suffix,
+        defer_variant_build,
         kwargs,
     ):
-        request_bases = tuple(_resolve_annotation(b, REQUEST_ATTR) for b in bases)
-        request_kwargs = kwargs.copy()
-        if "extra" in request_kwargs:
-            request_kwargs["extra"] = "forbid"
+        request_bases = _resolve_bases(bases, REQUEST_ATTR)
+        # Only an explicit "extra" other than forbid makes the variants' kwargs differ.
+        # Otherwise they share one dict and the request model inherits forbid from its base.
+        request_kwargs = kwargs
+        if kwargs.get("extra", "forbid") != "forbid":
+            request_kwargs = {**kwargs, "extra": "forbid"}
+        # Computed once and shared by all three variants so that none of them
+        # has to walk the annotations that cannot change between variants
+        invariant_annotations = _get_invariant_annotations(attrs)
         request_class = ModelMetaclass(
             name + request_suffix,
             request_bases,
-            _alter_attrs(attrs, name, request_suffix, REQUEST_ATTR),
+            _alter_attrs(
+                attrs, name, request_suffix, REQUEST_ATTR, invariant_annotations
+            ),
             **request_kwargs,
         )
-        request_class.__response__ = _lazily_initalize_models(
+        # Otherwise it would be inherited from the request model of the closest dual base
+        type.__setattr__(request_class, REQUEST_ATTR, request_class)
+        response_kwargs, patch_request_kwargs = kwargs, request_kwargs
+        if "defer_build" not in request_class.model_config:
+            # The request model has to stay eagerly built because the dual model proxies its schema.
+            # Set either way because otherwise the variants inherit it from their parents' configs.
+            response_kwargs = {**response_kwargs, "defer_build": defer_variant_build}
+            patch_request_kwargs = {
+                **patch_request_kwargs,
+                "defer_build": defer_variant_build,
+            }
+        request_class.__response__ = _LazyVariant(
             request_class,
             RESPONSE_ATTR,
             lambda: ModelMetaclass(
                 name + response_suffix,
-                tuple(_resolve_annotation(b, RESPONSE_ATTR) for b in bases),
-                _alter_attrs(attrs, name, response_suffix, RESPONSE_ATTR),
-                **kwargs,
+                _resolve_bases(bases, RESPONSE_ATTR),
+                _alter_attrs(
+                    attrs, name, response_suffix, RESPONSE_ATTR, invariant_annotations
+                ),
+                **response_kwargs,
             ),
+            is_variant=True,
         )
-        patch_attrs: dict[str, Any] = {
-            key: _replace_with_or_none(val)
-            if key in request_class.model_fields
-            else val
-            for key, val in attrs.items()
-        }
-        if "__annotations__" in attrs and isinstance(attrs["__annotations__"], dict):
-            patch_attrs |= {
-                key: None
-                for key in attrs["__annotations__"]
-                if key not in patch_attrs and key in request_class.model_fields
-            }
-        request_class.__patch_request__ = _lazily_initalize_models(
+        request_class.__patch_request__ = _LazyVariant(
             request_class,
             PATCH_REQUEST_ATTR,
             lambda: ModelMetaclass(
                 name + patch_request_suffix,
-                tuple(_resolve_annotation(b, PATCH_REQUEST_ATTR) for b in bases),
+                _resolve_bases(bases, PATCH_REQUEST_ATTR),
                 _alter_attrs(
-                    patch_attrs, name, patch_request_suffix, PATCH_REQUEST_ATTR
+                    _get_patch_request_attrs(attrs, request_class.model_fields),
+                    name,
+                    patch_request_suffix,
+                    PATCH_REQUEST_ATTR,
+                    invariant_annotations,
                 ),
-                **request_kwargs,
+                **patch_request_kwargs,
             ),
+            is_variant=True,
         )
         type.__setattr__(self, REQUEST_ATTR, request_class)
         return request_class
 
     def __getattribute__(self, attr: str):
         # Note here that RESPONSE_ATTR and PATCH_REQUEST_ATTR goes into REQUEST_ATTR's __getattribute__ method
+        if attr[:1] != "_":
+            # Public names (fields, validators, pydantic's model_* API) are the common case
+            # and can never be the metaclass's own or be looked up before the request model exists
+            return getattr(_type_getattribute(self, REQUEST_ATTR), attr)
+        if attr in _METACLASS_OWN_ATTRS:
+            return _type_getattribute(self, attr)
         try:
-            request_attr = type.__getattribute__(self, REQUEST_ATTR)
+            request_attr = _type_getattribute(self, REQUEST_ATTR)
         except AttributeError:
-            request_attr = None
-        if (
-            attr
-            in {
-                REQUEST_ATTR,
-                "__new__",
-                "_generate_base_alternative_classes",
-                "_generate_alternative_classes",
-            }
-            or request_attr is None
-        ):
-            return type.__getattribute__(self, attr)
+            # Only the root DualBaseModel during its creation has no request model yet
+            return _type_getattribute(self, attr)
         return getattr(request_attr, attr)
 
     def __setattr__(self, attr: str, value: object):
-        return setattr(type.__getattribute__(self, REQUEST_ATTR), attr, value)
+        return setattr(_type_getattribute(self, REQUEST_ATTR), attr, value)
 
     def __dir__(self) -> Iterable[str]:
-        return set(super().__dir__()).union(set(dir(getattr(self, REQUEST_ATTR))))
+        request_class = _type_getattribute(self, REQUEST_ATTR)
+        # dir() sorts whatever we return so the request model's names don't have to be sorted first
+        return {*super().__dir__(), *type(request_class).__dir__(request_class)}
 
     def __eq__(self, __o: object) -> bool:
+        if self is __o:
+            return True
         if isinstance(__o, DualBaseModelMeta):
             return super().__eq__(__o)
         else:
-            return self.__request__ == __o
+            return _type_getattribute(self, REQUEST_ATTR) == __o
 
     def __hash__(self) -> int:
-        return hash(self.__request__)
+        # Dual models are hashed as dict keys by typing's and pydantic's caches all the time
+        return _type_getattribute(self, DUAL_HASH_ATTR)
 
     def __instancecheck__(cls, instance) -> bool:
-        return type.__instancecheck__(cls, instance) or isinstance(
-            instance, (cls.__request__, cls.__response__, cls.__patch_request__)
-        )
+        if type.__instancecheck__(cls, instance):
+            return True
+        return isinstance(instance, cls._get_all_variants())
 
     def __subclasscheck__(cls, subclass: type):
-        return type.__subclasscheck__(cls, subclass) or issubclass(
-            subclass, (cls.__request__, cls.__response__, cls.__patch_request__)
-        )
+        if subclass is cls or type.__subclasscheck__(cls, subclass):
+            return True
+        return issubclass(subclass, cls._get_all_variants())
+
+    def _get_all_variants(cls) -> Tuple[type, ...]:
+        variants = _type_getattribute(cls, ALL_VARIANTS_ATTR)
+        if variants is None:
+            # Going through the request model directly skips the proxying __getattribute__
+            request_class = _type_getattribute(cls, REQUEST_ATTR)
+            request_dict = request_class.__dict__
+            variants = (
+                request_class,
+                request_dict[RESPONSE_ATTR],
+                request_dict[PATCH_REQUEST_ATTR],
+            )
+            if any(isinstance(v, _LazyVariant) for v in variants):
+                # Nothing can be an instance or a subclass of a variant that was never built
+                # so we skip it without building it and try caching the tuple next time
+                return tuple(v for v in variants if not isinstance(v, _LazyVariant))
+            type.__setattr__(cls, ALL_VARIANTS_ATTR, variants)
+        return variants
+
+
+_TYPE_RESOLVERS[DualBaseModelMeta] = _resolve_dual_model
+
+
+def clear_dual_cache() -> None:
+    """Forgets every resolved annotation and every class reused by reuse_definitions.
+
+    Useful in tests and in long-running processes that redefine the same dual models
+    on purpose and want fresh classes each time.
+    """
+    _CLASS_CACHE.clear()
+    _RESOLVE_CACHE.clear()
 
 
 def generate_dual_base_model(
@@ -322,6 +674,8 @@ def generate_dual_base_model(
     response_suffix="Response",
     request_suffix="Request",
     patch_request_suffix="PatchRequest",
+    defer_build: bool = True,
+    reuse_definitions: bool = False,
 ) -> "Type[DualBaseModel]":
     if base_config is None:  # pragma: no branch
         base_config = ConfigDict()
@@ -332,6 +686,8 @@ def generate_dual_base_model(
         request_suffix=request_suffix,
         response_suffix=response_suffix,
         patch_request_suffix=patch_request_suffix,
+        defer_variant_build=defer_build,
+        reuse_definitions=reuse_definitions,
     ):
         model_config = base_config
         __response__: ClassVar[Type[Self]]
@@ -343,7 +699,8 @@ def generate_dual_base_model(
         patch_request_suffix: ClassVar[str]
 
         def __new__(cls, *args, **kwargs):
-            return cls.__request__(*args, **kwargs)
+            # Instantiation is the hottest path so it skips the proxying __getattribute__
+            return _type_getattribute(cls, REQUEST_ATTR)(*args, **kwargs)
 
         def __init_subclass__(cls, **kwargs) -> None:
             return object.__init_subclass__()
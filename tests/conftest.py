@@ -1,12 +1,14 @@
 import sys
-from typing import List, Optional
+from typing import List, Literal, Optional, Union
 
 import pytest
+from pydantic import Field
+from typing_extensions import Annotated
 
 from pydantic_duality import DualBaseModel, generate_dual_base_model
 
 
-@pytest.fixture(params=[True, False])
+@pytest.fixture(scope="session", params=[True, False])
 def schemas(request):
     if request.param:
         Base = generate_dual_base_model()
@@ -50,3 +52,21 @@ def schemas(request):
             darkness: B
 
     return locals()
+
+
+@pytest.fixture(scope="session")
+def discriminated_schemas():
+    class ChildSchema1(DualBaseModel):
+        object_type: Literal[1]
+        obj: str
+
+    class ChildSchema2(DualBaseModel):
+        object_type: Literal[2]
+        obj: str
+
+    class Schema(DualBaseModel):
+        child: Annotated[
+            Union[ChildSchema1, ChildSchema2], Field(discriminator="object_type")
+        ]
+
+    return Schema, {1: ChildSchema1, 2: ChildSchema2}
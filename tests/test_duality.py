@@ -1,13 +1,20 @@
 import abc
 import sys
-from typing import Literal, Union
+from typing import Generic, Literal, Optional, TypeVar, Union
 
 import pydantic
 import pytest
 from pydantic import BaseModel, ConfigDict, Extra, Field, ValidationError
 from typing_extensions import Annotated
 
-from pydantic_duality import DualBaseModel, DualBaseModelMeta, _resolve_annotation
+from pydantic_duality import (
+    DualBaseModel,
+    DualBaseModelMeta,
+    _LazyVariant,
+    _resolve_annotation,
+    clear_dual_cache,
+    generate_dual_base_model,
+)
 
 
 def test_new(schemas):
@@ -35,6 +42,9 @@ if sys.version_info >= (3, 10):
         assert g.g == "g"
         assert h.h == "h"
 
+        h = UnionSchema.__response__(model=dict(h="h", extra="extra")).model
+        assert type(h) is schemas["H"].__response__
+
 
 def test_base_model():
     class Request(BaseModel, extra=Extra.forbid):
@@ -68,6 +78,12 @@ def test_dir():
     assert "parse_obj" in dir(Schema)
     assert "update_forward_refs" in dir(Schema)
 
+    Schema.some_attribute = 1
+    assert "some_attribute" in dir(Schema)
+
+    Schema.__request__.other_attribute = 1
+    assert "other_attribute" in dir(Schema)
+
 
 def test_lack_of_base_class():
     with pytest.raises(
@@ -110,15 +126,14 @@ def test_wrong_config_type_in_base_class(config: Union[str, int, None]):
         TypeError,
         match="The model_config attribute must be a dictionary.",
     ):
-
-        class Schema(
-            BaseModel,
-            metaclass=DualBaseModelMeta,
+        DualBaseModelMeta(
+            "Schema",
+            (BaseModel,),
+            {"model_config": config},
             request_suffix="Request",
             response_suffix="Response",
             patch_request_suffix="PatchRequest",
-        ):
-            model_config = config
+        )
 
 
 def test_issubclass_basemodel(schemas):
@@ -147,6 +162,18 @@ def test_isinstance_checks():
     assert isinstance(my_model_child, MyModelChild.__response__)
 
 
+def test_isinstance_checks_do_not_build_variants():
+    class Schema(DualBaseModel):
+        field: int
+
+    assert isinstance(Schema(field=1), Schema)
+    assert not isinstance(object(), Schema)
+    assert isinstance(vars(Schema.__request__)["__response__"], _LazyVariant)
+    assert isinstance(vars(Schema.__request__)["__patch_request__"], _LazyVariant)
+
+    assert isinstance(Schema.__response__(field=1), Schema)
+
+
 def test_main_schema_is_subclass_of_generated_schemas():
     class Schema(DualBaseModel):
         pass
@@ -226,30 +253,22 @@ def test_issubclass_weird_issubclass_error_in_reverse():
 
 
 def test_ignore_forbid_attrs(schemas):
-    assert (
-        schemas[
-            "A"
-        ].__request__.__response__.__response__.__request__.__response__.__request__.model_config[
-            "extra"
-        ]
-        == Extra.forbid
-    )
-    assert (
-        schemas[
-            "A"
-        ].__request__.__response__.__response__.__request__.__response__.__patch_request__.model_config[
-            "extra"
-        ]
-        == Extra.forbid
-    )
-    assert (
-        schemas[
-            "A"
-        ].__request__.__response__.__response__.__request__.__response__.__response__.model_config[
-            "extra"
-        ]
-        == Extra.ignore
-    )
+    # Longer chains such as A.__request__.__response__.__request__ collapse into
+    # these three models, see test_variants_point_at_each_other
+    assert schemas["A"].__request__.model_config["extra"] == Extra.forbid
+    assert schemas["A"].__patch_request__.model_config["extra"] == Extra.forbid
+    assert schemas["A"].__response__.model_config["extra"] == Extra.ignore
+
+
+def test_variants_point_at_each_other(schemas):
+    request = schemas["A"].__request__
+    response = schemas["A"].__response__
+    patch_request = schemas["A"].__patch_request__
+
+    for variant in (request, response, patch_request):
+        assert variant.__request__ is request
+        assert variant.__response__ is response
+        assert variant.__patch_request__ is patch_request
 
 
 def test_setattr():
@@ -278,6 +297,31 @@ if sys.version_info >= (3, 10):
         )
 
 
+def test_resolving_is_cached(schemas):
+    annotation = Union[schemas["A"], schemas["B"]]
+    resolved = _resolve_annotation(annotation, "__response__")
+
+    assert _resolve_annotation(annotation, "__response__") is resolved
+    assert _resolve_annotation(annotation, "__request__") is not resolved
+
+
+def test_resolving_keeps_annotations_without_dual_models():
+    annotation = Annotated[Union[int, list[str]], Field(description="desc")]
+
+    assert _resolve_annotation(annotation, "__response__") is annotation
+
+
+def test_resolving_with_metaclass_subclass():
+    class CustomMeta(DualBaseModelMeta):
+        pass
+
+    class A(DualBaseModel, metaclass=CustomMeta):
+        a: int
+
+    assert _resolve_annotation(A, "__response__") is A.__response__
+    assert _resolve_annotation(list[A], "__response__") == list[A.__response__]
+
+
 def test_model_creation(schemas):
     schemas["A"].__response__.parse_obj(
         {
@@ -307,82 +351,65 @@ def test_model_creation(schemas):
         )
 
 
-def test_annotated_model_creation_with_discriminator():
-    class ChildSchema1(DualBaseModel):
-        object_type: Literal[1]
-        obj: str
-
-    class ChildSchema2(DualBaseModel):
-        object_type: Literal[2]
-        obj: str
-
-    class Schema(DualBaseModel):
-        child: Annotated[
-            Union[ChildSchema1, ChildSchema2], Field(discriminator="object_type")
-        ]
+@pytest.mark.parametrize("object_type", [1, 2])
+def test_annotated_model_creation_with_discriminator(
+    discriminated_schemas, object_type: int
+):
+    Schema, child_schemas = discriminated_schemas
+    ChildSchema = child_schemas[object_type]
 
-    for object_type in (1, 2):
-        child_schema = Schema.parse_obj(
-            {"child": {"object_type": object_type, "obj": str(object_type)}}
-        )
-        child_req_schema = Schema.__request__.parse_obj(
-            {"child": {"object_type": object_type, "obj": str(object_type)}}
-        )
-        child_resp_schema = Schema.__response__.parse_obj(
-            {"child": {"object_type": object_type, "obj": str(object_type)}}
-        )
+    child_schema = Schema.parse_obj(
+        {"child": {"object_type": object_type, "obj": str(object_type)}}
+    )
+    child_req_schema = Schema.__request__.parse_obj(
+        {"child": {"object_type": object_type, "obj": str(object_type)}}
+    )
+    child_resp_schema = Schema.__response__.parse_obj(
+        {"child": {"object_type": object_type, "obj": str(object_type)}}
+    )
 
-        assert (
-            type(child_schema.child)
-            is locals()[f"ChildSchema{object_type}"].__request__
-        )
-        assert (
-            type(child_req_schema.child)
-            is locals()[f"ChildSchema{object_type}"].__request__
-        )
-        assert (
-            type(child_resp_schema.child)
-            is locals()[f"ChildSchema{object_type}"].__response__
-        )
-        with pytest.raises(ValidationError):
-            Schema.parse_obj(
-                {
-                    "child": {
-                        "object_type": object_type,
-                        "obj": object_type,
-                        "extra": "extra",
-                    }
-                }
-            )
-        with pytest.raises(ValidationError):
-            Schema.__request__.parse_obj(
-                {
-                    "child": {
-                        "object_type": object_type,
-                        "obj": object_type,
-                        "extra": "extra",
-                    }
+    assert type(child_schema.child) is ChildSchema.__request__
+    assert type(child_req_schema.child) is ChildSchema.__request__
+    assert type(child_resp_schema.child) is ChildSchema.__response__
+    with pytest.raises(ValidationError):
+        Schema.parse_obj(
+            {
+                "child": {
+                    "object_type": object_type,
+                    "obj": object_type,
+                    "extra": "extra",
                 }
-            )
-        with pytest.raises(pydantic.ValidationError):
-            Schema.__patch_request__.parse_obj(
-                {
-                    "child": {
-                        "object_type": object_type,
-                        "extra": "extra",
-                    }
+            }
+        )
+    with pytest.raises(ValidationError):
+        Schema.__request__.parse_obj(
+            {
+                "child": {
+                    "object_type": object_type,
+                    "obj": object_type,
+                    "extra": "extra",
                 }
-            )
-        Schema.__patch_request__.parse_obj({"child": {"object_type": object_type}})
-        Schema.__response__.parse_obj(
+            }
+        )
+    with pytest.raises(pydantic.ValidationError):
+        Schema.__patch_request__.parse_obj(
             {
                 "child": {
                     "object_type": object_type,
-                    "obj": str(object_type),
                     "extra": "extra",
                 }
             }
         )
+    Schema.__patch_request__.parse_obj({"child": {"object_type": object_type}})
+    Schema.__response__.parse_obj(
+        {
+            "child": {
+                "object_type": object_type,
+                "obj": str(object_type),
+                "extra": "extra",
+            }
+        }
+    )
 
 
 def test_patch_request_for_literal_with_multiple_values():
@@ -395,6 +422,34 @@ def test_patch_request_for_literal_with_multiple_values():
     assert schema.field2 == 4
 
 
+def test_patch_request_for_string_annotations():
+    class Schema(DualBaseModel):
+        field: "int"
+        field2: "Optional[int]"
+
+    assert Schema.__patch_request__.__annotations__ == {
+        "field": "Optional[int]",
+        "field2": "Optional[int]",
+    }
+    schema = Schema.__patch_request__()
+    assert schema.field is None
+    assert schema.field2 is None
+
+
+def test_patch_request_keeps_field_info():
+    class Schema(DualBaseModel):
+        field: int = Field(alias="alias", description="description")
+        field2: list = Field(default_factory=list)
+
+    schema = Schema.__patch_request__()
+    assert schema.field is None
+    assert schema.field2 is None
+    assert Schema.__patch_request__(alias=1).field == 1
+    assert Schema.__patch_request__.model_fields["field"].description == "description"
+    assert Schema.model_fields["field"].is_required()
+    assert Schema(alias=1).field2 == []
+
+
 @pytest.mark.parametrize(
     "field_type", [Annotated[int, "Hello"], Annotated[int, "Hello", "Darkness"]]
 )
@@ -428,6 +483,13 @@ def test_hash():
 
     assert hash(Schema.__request__) == hash(Schema)
 
+    class ChildSchema(Schema):
+        pass
+
+    # The hash is stored on each class so a subclass must not inherit its parent's
+    assert hash(ChildSchema) == hash(ChildSchema.__request__)
+    assert hash(ChildSchema) != hash(Schema)
+
 
 def test_set_items():
     class Schema(DualBaseModel):
@@ -509,6 +571,80 @@ def test_config_defined_in_kwargs():
         Schema(field=1, extra=2)
 
 
+def test_variant_build_is_deferred():
+    class Schema(DualBaseModel):
+        field: int
+
+    assert Schema.__request__.__pydantic_complete__
+    assert not Schema.__response__.__pydantic_complete__
+    assert not Schema.__patch_request__.__pydantic_complete__
+
+    assert Schema.__response__(field=1, extra=2).field == 1
+    assert Schema.__response__.__pydantic_complete__
+
+
+def test_variant_build_is_not_deferred():
+    class Schema(generate_dual_base_model(defer_build=False)):
+        field: int
+
+    assert Schema.__response__.__pydantic_complete__
+    assert Schema.__patch_request__.__pydantic_complete__
+
+
+def test_variant_build_is_not_deferred_in_subclass_of_deferred_model():
+    class Parent(DualBaseModel):
+        field: int
+
+    class Child(Parent, defer_variant_build=False):
+        other: int
+
+    assert not Parent.__response__.__pydantic_complete__
+    assert Child.__response__.__pydantic_complete__
+    assert Child.__patch_request__.__pydantic_complete__
+
+
+def test_identical_definitions_are_reused():
+    ReusingBaseModel = generate_dual_base_model(reuse_definitions=True)
+
+    def make_schema(field_type: type, base: type = ReusingBaseModel):
+        class Schema(base):
+            field: field_type
+            other: int = 1
+
+        return Schema
+
+    assert make_schema(int) is make_schema(int)
+    assert make_schema(int) is not make_schema(str)
+    assert make_schema(int).__response__ is make_schema(int).__response__
+    assert make_schema(int, DualBaseModel) is not make_schema(int, DualBaseModel)
+
+
+def test_generic_parametrization_is_delegated_to_request_model():
+    T = TypeVar("T")
+
+    class Schema(DualBaseModel, Generic[T]):
+        field: T
+
+    assert Schema[int] is Schema.__request__[int]
+    assert Schema[int](field="1").field == 1
+    assert Schema.__response__[int](field="1", extra="extra").field == 1
+
+
+def test_clear_dual_cache():
+    ReusingBaseModel = generate_dual_base_model(reuse_definitions=True)
+
+    def make_schema():
+        class Schema(ReusingBaseModel):
+            field: int
+
+        return Schema
+
+    schema = make_schema()
+    assert make_schema() is schema
+    clear_dual_cache()
+    assert make_schema() is not schema
+
+
 @pytest.mark.xfail(reason="Super calls are not supported yet")
 def test_super_calls_in_init():
     class Schema(DualBaseModel):